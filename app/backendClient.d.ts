@@ -16,9 +16,17 @@ export interface BackendClient {
   sendSilence(): void;
   selectModel(model: string): void;
   requestModels(): void;
+  requestHistory?(): void;
   setParams(params: BackendSetParamsPayload): void;
   triggerPartial(intervalMs: number): void;
   clearCachedData?(): Promise<void>;
 }
 
-export function createBackendClient(mode?: "ws" | "webgpu" | "whispercpp_wasm"): BackendClient;
+export interface BackendClientOptions {
+  wireFormat?: "json" | "msgpack";
+}
+
+export function createBackendClient(
+  mode?: "ws" | "webgpu" | "whispercpp_wasm",
+  options?: BackendClientOptions,
+): BackendClient;
@@ -3,8 +3,8 @@ import { WebGPUBackendClient } from './webgpuClient.js';
 import { WhisperCppWasmBackendClient } from './whisperCppWasmClient.js';
 
 class SocketBackendClient {
-  constructor() {
-    this.transport = new WSClient();
+  constructor(options = {}) {
+    this.transport = new WSClient(options);
   }
 
   connect() {
@@ -35,6 +35,10 @@ class SocketBackendClient {
     this.transport.sendControl({ type: 'request_models' });
   }
 
+  requestHistory() {
+    this.transport.sendControl({ type: 'request_history' });
+  }
+
   setParams(params) {
     this.transport.sendControl({
       type: 'set_params',
@@ -50,8 +54,8 @@ class SocketBackendClient {
   }
 }
 
-export function createBackendClient(mode = 'ws') {
-  if (mode === 'ws') return new SocketBackendClient();
+export function createBackendClient(mode = 'ws', options = {}) {
+  if (mode === 'ws') return new SocketBackendClient(options);
   if (mode === 'webgpu') return new WebGPUBackendClient();
   if (mode === 'whispercpp_wasm') return new WhisperCppWasmBackendClient();
   throw new Error(`Unsupported backend client mode: ${mode}`);
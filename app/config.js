@@ -15,6 +15,8 @@ export class ConfigManager {
       lapVoicePhrase: 'new subject',
       lapVoiceMatchMode: 'contains',
       copyVoicePhrase: 'copy last subject',
+      // 'json' or 'msgpack' (binary frames, decoder loaded from a CDN).
+      wireFormat: 'json',
     };
 
     this.globalKeys = [
@@ -23,6 +25,7 @@ export class ConfigManager {
       'lapVoicePhrase',
       'lapVoiceMatchMode',
       'copyVoicePhrase',
+      'wireFormat',
     ];
 
     this.familyNumericKeys = [
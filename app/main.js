@@ -35,7 +35,7 @@ export class App {
     const backendMode = backendModeConfig === 'webgpu'
       ? 'webgpu'
       : (backendModeConfig === 'whispercpp_wasm' ? 'whispercpp_wasm' : 'ws');
-    this.backend = createBackendClient(backendMode);
+    this.backend = createBackendClient(backendMode, { wireFormat: this.config.get('wireFormat') });
     this.transcriptItems = [];
     this.lapCount = 0;
     this.lastFinalText = '';
@@ -292,6 +292,14 @@ export class App {
         this.ui.updatePartialIntervalCurrent(this.partialIntervalCurrentMs);
         this.ui.logProcessingStats('Partial', data.stats);
       }
+      if (data.type === 'commit' && data.text) {
+        // Words two consecutive partials agreed on (LocalAgreement); the
+        // segment's final will only carry the remaining text.
+        this.pushTranscriptItem(this.createTranscriptItem('final', data.text, this.currentLapId, {
+          sourceFileKey: this.processingMode === 'file' ? this.currentFileKey : null,
+        }));
+        this.ui.setPartial('');
+      }
       if (data.type === 'final' && data.final !== undefined) {
         const segmentMeta = this.pendingSegmentMetaQueue.length
           ? this.pendingSegmentMetaQueue.shift()
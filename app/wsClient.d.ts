@@ -4,6 +4,8 @@ export class WSClient {
   ws: WebSocket | null;
   reconnectDelay: number;
   manualClose: boolean;
+  decodeBinary: ((data: Uint8Array) => any) | null;
+  wireFormat: "json" | "msgpack";
   listeners: Record<WSEvent, Array<(data?: any) => void>>;
   constructor(config?: any);
   subscribe(event: WSEvent, callback: (data?: any) => void): void;
@@ -1,12 +1,29 @@
 const currentURL = window.location;
 const protocol = currentURL.protocol === "https:" ? "wss:" : "ws:";
 const WS_URL = `${protocol}//${currentURL.hostname}:${currentURL.port}/stream`;
+const MSGPACK_MODULE_URL = 'https://cdn.jsdelivr.net/npm/@msgpack/msgpack@3.1.2/+esm';
+
+let msgpackModulePromise = null;
+
+// MessagePack is opt-in (config "wireFormat": "msgpack"); if the decoder
+// cannot be loaded (e.g. offline), the socket stays on JSON text frames.
+function loadMsgpack() {
+  if (!msgpackModulePromise) {
+    msgpackModulePromise = import(MSGPACK_MODULE_URL).catch((err) => {
+      console.warn('MessagePack decoder unavailable, using JSON frames', err);
+      return null;
+    });
+  }
+  return msgpackModulePromise;
+}
 
 export class WSClient {
   constructor(config) {
     this.ws = null;
     this.reconnectDelay = 1000;
     this.manualClose = false;
+    this.decodeBinary = null;
+    this.wireFormat = config?.wireFormat === 'msgpack' ? 'msgpack' : 'json';
     this.listeners = {
       open: [],
       close: [],
@@ -31,7 +48,15 @@ export class WSClient {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) return;
     
     this.manualClose = false;
-    this.ws = new WebSocket(url);
+    // Only clients that opted into msgpack wait on the decoder import; if it
+    // fails to load, the socket falls back to JSON frames.
+    if (this.wireFormat === 'msgpack' && !this.decodeBinary) {
+      const msgpack = await loadMsgpack();
+      if (this.manualClose) return;
+      this.decodeBinary = msgpack ? msgpack.decode : null;
+    }
+    const target = this.decodeBinary ? `${url}${url.includes('?') ? '&' : '?'}format=msgpack` : url;
+    this.ws = new WebSocket(target);
     this.ws.binaryType = 'arraybuffer';
 
     this.ws.onopen = () => {
@@ -53,8 +78,15 @@ export class WSClient {
 
     this.ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data);
-        this.emit('message', data);
+        const data = event.data instanceof ArrayBuffer
+          ? this.decodeBinary(new Uint8Array(event.data))
+          : JSON.parse(event.data);
+        // The server coalesces bursts of messages into a single array frame.
+        if (Array.isArray(data)) {
+          data.forEach((item) => this.emit('message', item));
+        } else {
+          this.emit('message', data);
+        }
       } catch (err) {
         console.error('Failed to parse WebSocket message', err);
       }
@@ -1,8 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import psutil
+
+# Whisper already parallelizes internally; size its intra-op pool to the
+# physical cores (SMT siblings only add contention) before the inference
+# libraries are imported. Both backends read this value.
+os.environ.setdefault(
+    "OMP_NUM_THREADS", str(psutil.cpu_count(logical=False) or max(1, (os.cpu_count() or 2) // 2))
+)
+
 from download_model import SUPPORTED, fetch_model
 from cpp_model import download_cpp_model, list_cpp_downloadable_models
 from whisper_engine import WhisperEngine
@@ -19,6 +29,19 @@ CPP_QUANT_SUFFIXES_FALLBACK = (
     "q5_1",
 )
 
+# Single process-wide worker for inference: every connection queues here instead
+# of spreading transcriptions over the default executor, so concurrent clients
+# do not fight over the same cores and caches.
+INFER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+# Model downloads get their own small pool so a slow fetch never ties up the
+# default executor other libraries share.
+DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="download")
+
+_models_generation = 0
+# mtimes of the model directories when the listings were last built; entries
+# being added, removed or renamed (e.g. by install.sh) change them.
+_models_dirs_mtimes: tuple = ()
+
 def _make_engine(model_size: str):
     if BACKEND == "cpp":
         # Ensure model exists before creating wrapper
@@ -30,8 +53,10 @@ def _make_engine(model_size: str):
             def __init__(self, name: str):
                 self.model_size = name
 
-            def transcribe_array(self, audio, language=None, is_partial=False):
-                return server_manager.transcribe_array(self.model_size, audio, language=language, is_partial=is_partial)
+            def transcribe_array(self, audio, language=None, is_partial=False, cancel_event=None):
+                return server_manager.transcribe_array(
+                    self.model_size, audio, language=language, is_partial=is_partial, cancel_event=cancel_event
+                )
 
             def transcribe_file(self, file_path, language=None):
                 return server_manager.transcribe_file(self.model_size, file_path, language=language)
@@ -54,9 +79,50 @@ def installed_models() -> List[str]:
 
 
 def installed_models_info() -> Dict[str, Dict[str, float]]:
+    _check_models_dirs()
+    return dict(_scan_installed_models_info())
+
+
+def invalidate_installed() -> None:
+    """Forget cached model listings; call after a model is downloaded or removed."""
+    global _models_generation
+    _models_generation += 1
+    _scan_installed_models_info.cache_clear()
+    _supported_models_cached.cache_clear()
+
+
+def models_generation() -> int:
+    """Counter bumped by invalidate_installed(), for caches built on the listings."""
+    _check_models_dirs()
+    return _models_generation
+
+
+def _models_root() -> Path:
+    return Path(os.getenv("WHISPER_MODELS_DIR") or Path(__file__).resolve().parent / "models")
+
+
+def _check_models_dirs() -> None:
+    # Three stat() calls instead of a rescan: catches models installed or
+    # removed outside this process without walking the directories.
+    global _models_dirs_mtimes
+    root = _models_root()
+    mtimes = []
+    for path in (root, root / "faster", root / "cpp"):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    mtimes = tuple(mtimes)
+    if mtimes != _models_dirs_mtimes:
+        _models_dirs_mtimes = mtimes
+        invalidate_installed()
+
+
+@lru_cache(maxsize=1)
+def _scan_installed_models_info() -> Dict[str, Dict[str, float]]:
     info: Dict[str, Dict[str, float]] = {}
 
-    models_root = Path(os.getenv("WHISPER_MODELS_DIR") or Path(__file__).resolve().parent / "models")
+    models_root = _models_root()
 
     faster_dir = models_root / "faster"
     if faster_dir.exists():
@@ -107,6 +173,12 @@ def _dir_size_bytes(path: Path) -> int:
 
 
 def supported_models() -> List[str]:
+    _check_models_dirs()
+    return list(_supported_models_cached())
+
+
+@lru_cache(maxsize=1)
+def _supported_models_cached() -> tuple[str, ...]:
     supported = set(SUPPORTED)
 
     # For whisper.cpp backend, expose quantized options without relying solely on network calls.
@@ -123,7 +195,7 @@ def supported_models() -> List[str]:
     # Always include locally installed models (e.g., manually downloaded quantized files).
     supported.update(installed_models())
 
-    return sorted(supported)
+    return tuple(sorted(supported))
 
 
 def available_models() -> List[str]:
@@ -146,5 +218,6 @@ def ensure_engine(model_size: Optional[str] = None, download: bool = True):
             download_cpp_model(size, models_root=os.getenv("WHISPER_MODELS_DIR"))
         else:
             fetch_model(size, backend="faster")
+        invalidate_installed()
         get_engine.cache_clear()
         return get_engine(size)
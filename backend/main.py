@@ -118,7 +118,9 @@ async def transcribe(
             raise HTTPException(status_code=400, detail=f"Failed to save upload: {exc}") from exc
 
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        # Whole-file uploads stay off INFER_EXECUTOR: a long file there would
+        # stall every live stream's partials and finals until it finished.
         result = await loop.run_in_executor(None, engine.transcribe_file, temp_path)
     finally:
         try:
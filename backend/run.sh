@@ -45,4 +45,10 @@ for path in \
 done
 export WHISPER_SERVER_BIN=${WHISPER_SERVER_BIN:-$DEFAULT_SERVER_BIN}
 echo "Using WHISPER_SERVER_BIN=${WHISPER_SERVER_BIN}, WHISPER_CPP_BIN=${WHISPER_CPP_BIN}"
-uvicorn main:app --host 0.0.0.0 --port 8000 --reload
+# permessage-deflate buys nothing on float32 PCM frames (near-incompressible) and costs CPU
+# on every audio chunk; keep it off unless explicitly requested.
+WS_PER_MESSAGE_DEFLATE=${WHISPER_WS_DEFLATE:-false}
+# uvloop ships with uvicorn[standard]; pin it instead of relying on "auto" so a
+# broken install fails loudly rather than silently falling back to asyncio.
+UVICORN_LOOP=${WHISPER_UVICORN_LOOP:-uvloop}
+uvicorn main:app --host 0.0.0.0 --port 8000 --reload --ws-per-message-deflate "$WS_PER_MESSAGE_DEFLATE" --loop "$UVICORN_LOOP"
@@ -4,32 +4,95 @@ from typing import Callable, Awaitable
 class AudioSegmenter:
     def __init__(self, min_seconds: float, max_seconds: float, sample_rate: int, on_segment_ready: Callable[[np.ndarray], Awaitable[None]]):
         self.min_seconds = min_seconds
-        self.max_seconds = max_seconds
         self.sample_rate = sample_rate
         self.on_segment_ready = on_segment_ready
-        self.buffer = np.zeros(0, dtype=np.float32)
+        # Preallocated storage sized for a full segment; only the first
+        # `_length` samples are live, so appends copy just the new chunk.
+        self._data = np.zeros(int(max_seconds * sample_rate), dtype=np.float32)
+        self._length = 0
+        self.max_seconds = max_seconds
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max_seconds
+
+    @max_seconds.setter
+    def max_seconds(self, value: float):
+        # Reserve the full segment up front so a raised limit never grows
+        # the buffer mid-stream; lowering it keeps the larger allocation.
+        self._max_seconds = value
+        self._ensure_capacity(int(value * self.sample_rate))
+
+    @property
+    def buffer(self) -> np.ndarray:
+        return self._data[: self._length]
+
+    def snapshot(self) -> np.ndarray:
+        """Read-only, zero-copy view of the live samples.
+
+        Appends only write past the current length, so the view stays intact
+        until the next flush/reset/advance; callers that outlive those must
+        treat the contents as stale (ws.py checks the segment id).
+        """
+        view = self._data[: self._length]
+        view.flags.writeable = False
+        return view
+
+    def _ensure_capacity(self, needed: int):
+        if needed <= self._data.size:
+            return
+        grown = np.zeros(max(needed, self._data.size * 2), dtype=np.float32)
+        grown[: self._length] = self._data[: self._length]
+        self._data = grown
 
     async def push_audio_chunk(self, chunk: np.ndarray):
         if chunk.size == 0:
             return
-        self.buffer = np.concatenate((self.buffer, chunk))
-        
-        current_duration = self.buffer.size / self.sample_rate
+        end = self._length + chunk.size
+        self._ensure_capacity(end)
+        self._data[self._length : end] = chunk
+        self._length = end
+        await self._check_max_duration()
+
+    async def push_audio_raw(self, raw: bytes):
+        """Append float32 samples straight from a websocket frame buffer.
+
+        The frame is copied once, into the preallocated storage; a trailing
+        partial sample (frame length not a multiple of 4) is ignored.
+        """
+        count = len(raw) // 4
+        if count == 0:
+            return
+        end = self._length + count
+        self._ensure_capacity(end)
+        self._data[self._length : end] = np.frombuffer(raw, dtype=np.float32, count=count)
+        self._length = end
+        await self._check_max_duration()
+
+    async def _check_max_duration(self):
+        current_duration = self._length / self.sample_rate
         if current_duration >= self.max_seconds:
             await self.flush()
 
     async def notify_silence(self):
-        current_duration = self.buffer.size / self.sample_rate
+        current_duration = self._length / self.sample_rate
         if current_duration >= self.min_seconds:
             await self.flush()
 
     async def flush(self):
-        if self.buffer.size == 0:
+        if self._length == 0:
             return
         # Copy buffer to ensure we don't modify it if the callback is slow/async
-        data_to_process = np.copy(self.buffer)
-        self.buffer = np.zeros(0, dtype=np.float32)
+        data_to_process = self._data[: self._length].copy()
+        self._length = 0
         await self.on_segment_ready(data_to_process)
-        
+
+    def advance(self, samples: int):
+        """Drop `samples` from the head of the buffer (audio already committed)."""
+        samples = min(samples, self._length)
+        remaining = self._length - samples
+        self._data[:remaining] = self._data[samples : self._length]
+        self._length = remaining
+
     def reset(self):
-        self.buffer = np.zeros(0, dtype=np.float32)
+        self._length = 0
@@ -1,5 +1,7 @@
 import logging
+import math
 import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -71,6 +73,10 @@ class WhisperEngine:
                         str(model_path),
                         device=device,
                         compute_type=ctype,
+                        # One inference runs at a time (INFER_EXECUTOR), so no
+                        # inter-op workers; intra-op threads come from
+                        # OMP_NUM_THREADS, which CTranslate2 reads itself.
+                        num_workers=1,
                     )
                     # Save the actual configuration that worked.
                     self.compute_type = ctype
@@ -121,7 +127,9 @@ class WhisperEngine:
             return "float16"
         return "int8_float16"
 
-    def _run_transcription(self, source, language: Optional[str]) -> Dict:
+    def _run_transcription(
+        self, source, language: Optional[str], cancel_event: Optional[threading.Event] = None
+    ) -> Dict:
         segments_iter, info = self.model.transcribe(
             source,
             language=language,
@@ -131,6 +139,9 @@ class WhisperEngine:
         text_parts: List[str] = []
         segments: List[Dict] = []
         for segment in segments_iter:
+            # Segments are decoded lazily; stop pulling once the caller gave up.
+            if cancel_event is not None and cancel_event.is_set():
+                break
             seg_text = segment.text.strip()
             segments.append(
                 {
@@ -147,16 +158,21 @@ class WhisperEngine:
         return self._run_transcription(file_path, language)
 
     def transcribe_array(
-        self, audio: np.ndarray, language: Optional[str] = None
+        self,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        is_partial: bool = False,
+        cancel_event: Optional[threading.Event] = None,
     ) -> Dict:
         if audio.ndim != 1:
             audio = np.mean(audio, axis=1)
-        audio = audio.astype(np.float32)
+        audio = audio.astype(np.float32, copy=False)
         # Skip inference on effectively silent buffers to avoid backend errors.
-        if audio.size == 0 or float(np.max(np.abs(audio))) < 1e-5:
+        # RMS via a single dot product: no temporaries for abs/square.
+        if audio.size == 0 or math.sqrt(float(np.dot(audio, audio)) / audio.size) < 1e-5:
             return {"text": "", "segments": [], "language": language}
         try:
-            return self._run_transcription(audio, language)
+            return self._run_transcription(audio, language, cancel_event)
         except Exception as exc:  # pragma: no cover - runtime safeguard
             logger.warning("Streaming transcription failed: %s", exc)
             return {"text": "", "segments": [], "language": language}
@@ -13,6 +13,16 @@ import soundfile as sf
 import numpy as np
 
 
+def _omp_threads(default: int) -> int:
+    # OMP_NUM_THREADS may be empty or a nested list like "4,2"; use the
+    # outer level and fall back to the default on anything unparsable.
+    try:
+        threads = int(os.getenv("OMP_NUM_THREADS", "").split(",")[0])
+    except ValueError:
+        return default
+    return threads if threads > 0 else default
+
+
 class WhisperServerProcess:
     def __init__(self, model_path: Path, server_bin: Path, port: int, threads: int = 4) -> None:
         self.model_path = model_path
@@ -66,8 +76,8 @@ class WhisperServerProcess:
                 f.close()
         # wait for server to bind or die
         timeout = float(os.getenv("WHISPER_SERVER_START_TIMEOUT", "60"))
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < timeout:
             if self.proc and self.proc.poll() is not None:
                 raise RuntimeError(f"whisper-server exited immediately, see log {log_file}")
             try:
@@ -185,7 +195,12 @@ class WhisperServerManager:
             if not self.server_bin or not self.server_bin.exists():
                 raise FileNotFoundError("whisper-server binary not found. Run install.sh to build it.")
             port = self._reserve_port()
-            proc = WhisperServerProcess(model_path=model_path, server_bin=self.server_bin, port=port)
+            proc = WhisperServerProcess(
+                model_path=model_path,
+                server_bin=self.server_bin,
+                port=port,
+                threads=_omp_threads(default=4),
+            )
             proc.start()
             self.processes[model_name] = proc
             print(f"[server-manager] started whisper-server for {model_name} on port {port}")
@@ -204,7 +219,14 @@ class WhisperServerManager:
             s.bind(("127.0.0.1", 0))
             return s.getsockname()[1]
 
-    def transcribe_array(self, model_name: str, audio: np.ndarray, language: str = None, is_partial: bool = False) -> Dict:
+    def transcribe_array(
+        self,
+        model_name: str,
+        audio: np.ndarray,
+        language: str = None,
+        is_partial: bool = False,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Dict:
         proc = self._get_or_start(model_name)
         with proc.lock:
             proc.active_requests += 1
@@ -213,6 +235,10 @@ class WhisperServerManager:
             sf.write(tmp.name, audio, samplerate=16000)
             tmp_path = Path(tmp.name)
         try:
+            # The HTTP request cannot be aborted server-side once sent, so the
+            # last chance to skip a cancelled partial is right before posting.
+            if cancel_event is not None and cancel_event.is_set():
+                return {"text": "", "segments": []}
             with tmp_path.open("rb") as f:
                 files = {"file": (tmp_path.name, f, "audio/wav")}
                 data = {
@@ -221,9 +247,9 @@ class WhisperServerManager:
                 }
                 url = f"http://127.0.0.1:{proc.port}/inference"
                 print(f"[server-manager] POST {url} audio={tmp_path.name} lang={data['language']}")
-                start_time = time.time()
+                start_time = time.monotonic()
                 resp = self.session.post(url, files=files, data=data, timeout=120)
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 proc.update_latency(duration)
                 proc.increment_stats(is_partial)
                 print(f"[server-manager] Response {resp.status_code}: {resp.text[:200]}")
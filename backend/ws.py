@@ -1,20 +1,26 @@
 import asyncio
 import contextlib
-import json
-import time
 import os
 import logging
+import threading
 import unicodedata
+from functools import lru_cache, partial
 from typing import Optional
 
+import msgpack
 import numpy as np
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from engine_manager import (
     DEFAULT_MODEL,
+    DOWNLOAD_EXECUTOR,
+    INFER_EXECUTOR,
     ensure_engine,
     installed_models,
     installed_models_info,
+    invalidate_installed,
+    models_generation,
     supported_models,
     BACKEND,
 )
@@ -29,14 +35,31 @@ logger = logging.getLogger(__name__)
 SAMPLE_RATE = 16000
 DEFAULT_MAX_SECONDS = 10
 DEFAULT_MIN_SECONDS = 2.0
-
-IGNORED_TEXTS = {
-    "Thank you.",
-    "[BLANK_AUDIO]",
-    "Thanks for watching!",
-    "MBC News",
-    "You",
-}
+# Partials are not attempted on less than 0.5s of audio.
+MIN_PARTIAL_SAMPLES = int(SAMPLE_RATE * 0.5)
+# Adaptive partial cadence: EMA weight of the latest partial latency, and how
+# far above that average the interval between partials is kept.
+PARTIAL_EMA_ALPHA = 0.3
+PARTIAL_LATENCY_HEADROOM = 1.2
+# Mean-square energy (RMS 1e-5) below which a chunk is treated as digital silence.
+SILENCE_ENERGY_FLOOR = 1e-10
+# Mean-square energy (about -60 dBFS RMS) below which a whole segment is not
+# worth an encoder pass; Whisper only hallucinates on such buffers.
+SEGMENT_ENERGY_FLOOR = 1e-6
+
+# Known Whisper hallucinations on silence/noise, compared case-insensitively
+# against the stripped text (callers look up text.lower()).
+IGNORED_TEXTS = frozenset({
+    "thank you.",
+    "[blank_audio]",
+    "[music]",
+    "thanks for watching!",
+    "thanks for watching.",
+    "thank you for watching!",
+    "thank you for watching.",
+    "mbc news",
+    "you",
+})
 
 CODE_TO_NAME = {
     "en": "English", "zh": "Chinese", "de": "German", "es": "Spanish", "ru": "Russian", 
@@ -58,13 +81,17 @@ CODE_TO_NAME = {
     "yi": "Yiddish", "haw": "Hawaiian", "jw": "Javanese", "sd": "Sindhi", "ku": "Kurdish", 
     "tg": "Tajik", "tt": "Tatar", "cr": "Cree", "bo": "Tibetan",
 }
+# Lower-cased full names back to their canonical spelling, for normalize_language.
+_NAME_LOWER_TO_CANONICAL = {name.lower(): name for name in CODE_TO_NAME.values()}
 
 
+@lru_cache(maxsize=4096)
 def _is_latin_like(ch: str) -> bool:
     """Return True if the character belongs to a Latin-based script.
 
     This covers English and Portuguese (and most western languages) by
-    checking the Unicode name for the substring 'LATIN'.
+    checking the Unicode name for the substring 'LATIN'. Results are cached
+    per character, since transcripts keep reusing the same alphabet.
     """
 
     try:
@@ -85,18 +112,31 @@ def should_ignore_non_latin(text: str, allow_non_latin: bool) -> bool:
     if allow_non_latin:
         return False
 
+    # Pure-ASCII text has no non-Latin letters; CPython answers this from the
+    # string's stored kind without walking the characters.
+    if text.isascii():
+        return False
+
     has_letter = False
     has_latin = False
 
     for ch in text:
         if ch.isalpha():
             has_letter = True
-            if _is_latin_like(ch):
+            # ASCII letters are Latin by definition; skip the Unicode lookup.
+            if ch.isascii() or _is_latin_like(ch):
                 has_latin = True
                 break
 
     return has_letter and not has_latin
 
+
+def _should_drop(text: str, allow_non_latin: bool) -> bool:
+    """Single gate for results not worth showing: empty, a known
+    hallucination, or non‑Latin-only when that is not allowed."""
+    return not text or text.lower() in IGNORED_TEXTS or should_ignore_non_latin(text, allow_non_latin)
+
+
 def normalize_language(lang: str) -> str:
     if not lang:
         return None
@@ -106,9 +146,9 @@ def normalize_language(lang: str) -> str:
         
     # Check if it's a full name match
     clean_lang = lang.lower()
-    for name in CODE_TO_NAME.values():
-        if name.lower() == clean_lang:
-            return name
+    name = _NAME_LOWER_TO_CANONICAL.get(clean_lang)
+    if name:
+        return name
             
     # Extract code (first 2 chars or split by hyphen)
     code = clean_lang.split("-")[0]
@@ -145,14 +185,161 @@ def _normalize_segments(raw_segments) -> list[dict]:
         )
     return normalized
 
+
+# Queued by the silence timer in place of a websocket message.
+_SILENCE_TICK = object()
+
+
+def _dumps(payload) -> str:
+    # orjson encodes straight to UTF-8 bytes; JSON clients read text frames.
+    return orjson.dumps(payload).decode()
+
+
+def _json_batch(frames: list[str]) -> str:
+    return "[" + ",".join(frames) + "]"
+
+
+_msgpack_packer = msgpack.Packer(use_bin_type=True)
+
+
+def _msgpack_batch(frames: list[bytes]) -> bytes:
+    # Already-packed items concatenated after an array header form a valid array.
+    return _msgpack_packer.pack_array_header(len(frames)) + b"".join(frames)
+
+
+# Outbound wire formats: (encode one payload, join several encoded frames).
+# "json" frames are str and go out as text; "msgpack" frames are bytes.
+WIRE_FORMATS = {
+    "json": (_dumps, _json_batch),
+    "msgpack": (_msgpack_packer.pack, _msgpack_batch),
+}
+
+_CONSTANT_PAYLOADS = {
+    "transcribing": {"status": "transcribing segment"},
+    "waiting_model": {"status": "waiting for model load..."},
+    "model_failed": {"error": "Model failed to load"},
+}
+
+
+@lru_cache(maxsize=None)
+def _constant_frame(wire_format: str, name: str):
+    # Constant frames are encoded once per wire format instead of on every send.
+    encode, _ = WIRE_FORMATS[wire_format]
+    return encode(_CONSTANT_PAYLOADS[name])
+
+
+@lru_cache(maxsize=64)
+def _status_frame(wire_format: str, status: str):
+    # Per-model statuses ("switching to ...") recur as users flip between
+    # a handful of models, so they are cached too.
+    encode, _ = WIRE_FORMATS[wire_format]
+    return encode({"status": status})
+
+
+def _models_payload(current_model: str, wire_format: str):
+    return _encoded_models(wire_format, current_model, models_generation())
+
+
+@lru_cache(maxsize=16)
+def _encoded_models(wire_format: str, current_model: str, generation: int):
+    # The listings generation is part of the key, so a model download
+    # (invalidate_installed) naturally misses and re-encodes.
+    encode, _ = WIRE_FORMATS[wire_format]
+    return encode(
+        {
+            "type": "models",
+            "supported": supported_models(),
+            "installed": installed_models(),
+            "installed_info": installed_models_info(),
+            "default": DEFAULT_MODEL,
+            "current": current_model,
+        }
+    )
+
+
+def _is_silent(audio: np.ndarray) -> bool:
+    return float(np.dot(audio, audio)) < SEGMENT_ENERGY_FLOOR * audio.size
+
+
+def _run_partial(engine, audio: np.ndarray, language: Optional[str], cancel_event: threading.Event):
+    # Runs on the inference worker. The job may sit behind other inference;
+    # cancel_event is set as soon as its segment closes (or the model
+    # changes), so a stale job skips the engine and a stale result is dropped.
+    if cancel_event.is_set():
+        return None
+    result = engine.transcribe_array(audio, language, is_partial=True, cancel_event=cancel_event)
+    return None if cancel_event.is_set() else result
+
+
+def _agreed_prefix_len(previous: list[str], current: list[str]) -> int:
+    agreed = 0
+    for prev_word, word in zip(previous, current):
+        if prev_word != word:
+            break
+        agreed += 1
+    return agreed
+
+
+def _commit_boundary(words: list[str], agreed: int, segments: list[dict], audio_samples: int) -> tuple[int, int]:
+    """Return (words, samples) of the agreed prefix that can be committed.
+
+    With segment timestamps only whole segments inside the agreement are
+    committed and the audio is cut at the last one's end. Without them
+    (whisper-server plain JSON) the cut is proportional to the word count.
+    """
+
+    if segments:
+        committed_words = 0
+        committed_samples = 0
+        for seg in segments:
+            seg_words = len(seg["text"].split())
+            if committed_words + seg_words > agreed:
+                break
+            committed_words += seg_words
+            committed_samples = int(seg["end"] * SAMPLE_RATE)
+        return committed_words, min(committed_samples, audio_samples)
+    return agreed, int(audio_samples * agreed / len(words))
+
+
+@lru_cache(maxsize=32)
+def _clamp_durations(min_seconds: float, max_seconds: float) -> tuple[float, float]:
+    """Keep max within [1, 60] seconds and min within [0.5, max]."""
+    max_seconds = max(1.0, min(max_seconds, 60.0))
+    min_seconds = max(0.5, min(min_seconds, max_seconds))
+    return min_seconds, max_seconds
+
+
+def _build_stats(audio_samples: int, process_time: float, partial_interval_s: float) -> dict:
+    # Each float is converted once and truncated so the payload stays short;
+    # timing is kept in seconds internally and only turned into ms here.
+    return {
+        "audio_duration": round(audio_samples / SAMPLE_RATE, 3),
+        "processing_time": round(process_time, 3),
+        "processing_time_ms": int(round(process_time * 1000)),
+        "partial_interval_ms": int(round(partial_interval_s * 1000)),
+    }
+
 @router.websocket("/stream")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     # await websocket.accept() # Moved down to avoid double accept if any logic before it fails or if we want to accept later
     engine_local: Optional = None
     final_history: list[str] = []
+    # Finals ship only their own text plus this running index; clients keep
+    # the history themselves and can ask for it with "request_history".
+    final_index = 0
+    # Bumped on every model switch (which resets the history); finals carry
+    # the value from when their segment closed, so one still transcribing
+    # for the old model is not counted into the new history.
+    history_epoch = 0
     current_model = DEFAULT_MODEL
     
     query_params = websocket.query_params
+    # Clients that can decode MessagePack opt in with ?format=msgpack.
+    wire_format = query_params.get("format", "json")
+    if wire_format not in WIRE_FORMATS:
+        wire_format = "json"
+    encode_frame, batch_frames = WIRE_FORMATS[wire_format]
+
     try:
         min_seconds = float(query_params.get("min_seconds", DEFAULT_MIN_SECONDS))
     except ValueError:
@@ -164,13 +351,16 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         max_seconds = DEFAULT_MAX_SECONDS
 
     # Ensure max_seconds and min_seconds are reasonable
-    max_seconds = max(1.0, min(max_seconds, 60.0))
-    min_seconds = max(0.5, min(min_seconds, max_seconds))
+    min_seconds, max_seconds = _clamp_durations(min_seconds, max_seconds)
 
     # New parameters
     current_language = "auto"
-    partial_interval_current_ms = 0.0
-    last_processing_ms = 0.0
+    partial_interval_current_s = 0.0
+    last_processing_s = 0.0
+    # Smoothed partial latency; triggers arriving sooner than
+    # PARTIAL_LATENCY_HEADROOM times it after the previous partial are skipped.
+    partial_ema_s = 0.0
+    last_partial_started = 0.0
     # If False, texts composed only of non‑Latin letters (e.g. Cyrillic)
     # will be ignored by default. Can be overridden by env or set_params.
     allow_non_latin = os.getenv("ALLOW_NON_LATIN", "0") == "1"
@@ -180,6 +370,15 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     last_processed_size = 0
     partial_processing_task = None
     is_processing_partial = False # Explicit flag for safety
+    # Set when the segment a running partial belongs to closes, so the engine
+    # can stop early instead of finishing work whose result is discarded.
+    partial_cancel: Optional[threading.Event] = None
+    # LocalAgreement-2: words two consecutive partials agree on are committed
+    # early and their audio trimmed, so later partials and the final only
+    # transcribe the uncommitted tail. Off unless LOCAL_AGREEMENT=1 or set_params.
+    local_agreement = os.getenv("LOCAL_AGREEMENT", "0") == "1"
+    prev_partial_words: list[str] = []
+    committed_samples = 0
     
     # await websocket.accept() # Already accepted by FastAPI? No, we need to accept.
     # The error "Expected ASGI message 'websocket.send' or 'websocket.close', but got 'websocket.accept'"
@@ -190,90 +389,110 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     
     await websocket.accept()
     logger.info("WebSocket connected")
+    # All timing uses the loop's monotonic clock, in seconds.
+    loop = asyncio.get_running_loop()
     
     # Track connection for the default model initially
     server_manager.update_socket_count(current_model, 1)
 
-    async def send_models_message():
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "models",
-                    "supported": supported_models(),
-                    "installed": installed_models(),
-                    "installed_info": installed_models_info(),
-                    "default": DEFAULT_MODEL,
-                    "current": current_model,
-                }
-            )
-        )
+    # Outbound frames are queued and drained by a single writer task; frames
+    # queued while a send is pending (or within one loop tick) go out
+    # together as one array frame.
+    outbox: list = []
+    outbox_ready = asyncio.Event()
+
+    def send_frame(frame) -> None:
+        outbox.append(frame)
+        outbox_ready.set()
+
+    def send_json(payload) -> None:
+        send_frame(encode_frame(payload))
+
+    async def write_frame(frame) -> None:
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+
+    def report_error(message: str, exc: Optional[BaseException] = None) -> None:
+        # Log once (with traceback when there is an exception) and tell the client.
+        logger.error(message, exc_info=exc)
+        send_json({"error": message})
+
+    async def drain_outbox():
+        while True:
+            await outbox_ready.wait()
+            outbox_ready.clear()
+            frames = outbox.copy()
+            outbox.clear()
+            await write_frame(frames[0] if len(frames) == 1 else batch_frames(frames))
+
+    def send_models_message():
+        send_frame(_models_payload(current_model, wire_format))
 
     async def load_engine(model_name: str) -> Optional:
+        # Happy path is a single "model_info" frame listing the status
+        # transitions; only an actual download gets its own progress frame.
+        transitions = [f"loading model {model_name}"]
         try:
-            await websocket.send_text(json.dumps({"status": f"loading model {model_name}"}))
-            eng = ensure_engine(model_name, download=False)
-            info = eng.info()
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "status": f"model loaded {info['model']}",
-                        "device": info.get("device"),
-                        "compute_type": info.get("compute_type"),
-                        "type": "model_info",
-                    }
-                )
-            )
-            return eng
-        except FileNotFoundError:
-            await websocket.send_text(json.dumps({"status": f"downloading model {model_name}"}))
-            loop = asyncio.get_event_loop()
             try:
+                eng = ensure_engine(model_name, download=False)
+            except FileNotFoundError:
+                send_frame(_status_frame(wire_format, f"downloading model {model_name}"))
+                transitions.append(f"downloading model {model_name}")
                 if BACKEND == "cpp":
-                    await loop.run_in_executor(None, download_cpp_model, model_name, os.getenv("WHISPER_MODELS_DIR"))
+                    await loop.run_in_executor(DOWNLOAD_EXECUTOR, download_cpp_model, model_name, os.getenv("WHISPER_MODELS_DIR"))
                 else:
-                    await loop.run_in_executor(None, fetch_model, model_name, BACKEND)
-                await websocket.send_text(json.dumps({"status": f"download complete {model_name}"}))
+                    await loop.run_in_executor(DOWNLOAD_EXECUTOR, fetch_model, model_name, BACKEND)
+                invalidate_installed()
+                transitions.append(f"download complete {model_name}")
                 eng = ensure_engine(model_name, download=False)
-                info = eng.info()
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "status": f"model loaded {info['model']}",
-                            "device": info.get("device"),
-                            "compute_type": info.get("compute_type"),
-                            "type": "model_info",
-                        }
-                    )
-                )
-                return eng
-            except Exception as exc:
-                logger.error("Model load failed (download): %s", exc, exc_info=True)
-                await websocket.send_text(json.dumps({"error": f"model load failed: {exc}"}))
-                return None
+            info = eng.info()
+            status = f"model loaded {info['model']}"
+            transitions.append(status)
+            send_json(
+                {
+                    "status": status,
+                    "transitions": transitions,
+                    "model": info["model"],
+                    "device": info.get("device"),
+                    "compute_type": info.get("compute_type"),
+                    "type": "model_info",
+                },
+            )
+            return eng
         except Exception as exc:
-            logger.error("Model load failed: %s", exc, exc_info=True)
-            await websocket.send_text(json.dumps({"error": f"model load failed: {exc}"}))
+            report_error(f"model load failed: {exc}", exc)
             return None
 
     final_segments_queue: asyncio.Queue = asyncio.Queue()
 
     async def on_segment_ready(audio_segment: np.ndarray):
-        nonlocal current_segment_id, last_processed_size, last_processing_ms, partial_interval_current_ms
+        nonlocal current_segment_id, last_processed_size, last_processing_s, partial_interval_current_s
+        nonlocal prev_partial_words, committed_samples
 
         # Invalidate current partials immediately when a final segment closes.
         current_segment_id += 1
-        segment_id = current_segment_id
+        if partial_cancel is not None:
+            partial_cancel.set()
         last_processed_size = 0
-        last_processing_ms = 0.0
-        partial_interval_current_ms = 0.0
+        last_processing_s = 0.0
+        partial_interval_current_s = 0.0
+        # Stats report the whole segment, including audio already committed.
+        segment_samples = audio_segment.size + committed_samples
+        prev_partial_words = []
+        committed_samples = 0
 
         if audio_segment.size == 0:
             return
 
-        await final_segments_queue.put((segment_id, np.copy(audio_segment), current_language))
+        # The segmenter hands over a fresh array on flush, so the queue takes
+        # ownership directly; freeze it so nothing mutates it mid-inference.
+        audio_segment.flags.writeable = False
+        await final_segments_queue.put((history_epoch, audio_segment, segment_samples, current_language))
 
     async def process_final_segments():
-        nonlocal engine_local, engine_task
+        nonlocal engine_local, engine_task, final_index
 
         while True:
             item = await final_segments_queue.get()
@@ -281,12 +500,12 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                 final_segments_queue.task_done()
                 break
 
-            _segment_id, audio_segment, language_for_segment = item
+            segment_epoch, audio_segment, segment_samples, language_for_segment = item
 
             try:
                 if engine_local is None:
                     if not engine_task.done():
-                        await websocket.send_text(json.dumps({"status": "waiting for model load..."}))
+                        send_frame(_constant_frame(wire_format, "waiting_model"))
                         try:
                             engine_local = await engine_task
                         except Exception:
@@ -295,66 +514,86 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                         engine_local = engine_task.result()
 
                 if engine_local is None:
-                    await websocket.send_text(json.dumps({"error": "Model failed to load"}))
+                    send_frame(_constant_frame(wire_format, "model_failed"))
+                    continue
+
+                if _is_silent(audio_segment):
+                    # Still answer with a (discarded) final: the client counts them.
+                    send_json({
+                        "type": "final",
+                        "final": "",
+                        "index": final_index,
+                        "segments": [],
+                        "discarded": True,
+                        "stats": _build_stats(segment_samples, 0.0, partial_interval_current_s),
+                    })
                     continue
 
-                loop = asyncio.get_event_loop()
-                await websocket.send_text(json.dumps({"status": "transcribing segment"}))
-                start_time = time.time()
+                send_frame(_constant_frame(wire_format, "transcribing"))
+                start_time = loop.time()
                 result = await loop.run_in_executor(
-                    None, engine_local.transcribe_array, audio_segment, language_for_segment
+                    INFER_EXECUTOR, engine_local.transcribe_array, audio_segment, language_for_segment
                 )
-                process_time = time.time() - start_time
-                audio_duration = audio_segment.size / SAMPLE_RATE
+                process_time = loop.time() - start_time
                 text = (result.get("text") or "").strip()
                 segments = _normalize_segments(result.get("segments"))
 
-                if text in IGNORED_TEXTS:
+                if _should_drop(text, allow_non_latin):
                     text = ""
 
-                if text and should_ignore_non_latin(text, allow_non_latin):
+                if text and segment_epoch != history_epoch:
+                    # The model switched (and the history reset) mid-inference;
+                    # still answer as discarded so the client's count stays balanced.
+                    logger.info("Final dropped: history reset while it was transcribing")
                     text = ""
 
                 if text:
                     final_history.append(text)
-                await websocket.send_text(json.dumps({
+                    final_index += 1
+                send_json({
                     "type": "final",
                     "final": text,
+                    "index": final_index,
                     "segments": segments,
-                    "history": final_history,
                     "discarded": not bool(text),
-                    "stats": {
-                        "audio_duration": audio_duration,
-                        "processing_time": process_time,
-                        "processing_time_ms": int(round(process_time * 1000)),
-                        "partial_interval_ms": int(round(partial_interval_current_ms)),
-                    }
-                }))
+                    "stats": _build_stats(segment_samples, process_time, partial_interval_current_s),
+                })
             except Exception as exc:
-                logger.error("Transcription failed: %s", exc, exc_info=True)
-                await websocket.send_text(json.dumps({"error": str(exc)}))
+                report_error(f"transcription failed: {exc}", exc)
             finally:
                 final_segments_queue.task_done()
 
     segmenter = AudioSegmenter(min_seconds, max_seconds, SAMPLE_RATE, on_segment_ready)
 
-    async def process_partial(requested_interval_ms: float = 0.0):
-        nonlocal engine_local, last_processed_size, is_processing_partial, last_processing_ms, partial_interval_current_ms
+    async def process_partial(requested_interval_s: float = 0.0):
+        nonlocal engine_local, last_processed_size, is_processing_partial, last_processing_s, partial_interval_current_s
+        nonlocal prev_partial_words, committed_samples, final_index, partial_cancel
+        nonlocal partial_ema_s, last_partial_started
         
         if is_processing_partial:
             logger.warning("Partial requested but is_processing_partial is True! Skipping.")
             return
 
+        # Never run partials faster than the engine can produce them, or they
+        # just queue up behind each other (and the finals) on the worker.
+        # Only measured latency throttles: interval_ms is the client's *next*
+        # interval (and runs on its audio clock), not the one it just waited.
+        if loop.time() - last_partial_started < PARTIAL_LATENCY_HEADROOM * partial_ema_s:
+            return
+
         # Check if we have enough audio in buffer to try a partial
         # We don't want to process extremely short segments
         current_size = segmenter.buffer.size
-        if current_size < SAMPLE_RATE * 0.5: # at least 0.5s
+        if current_size < MIN_PARTIAL_SAMPLES:
             return
 
         # Check if buffer has grown since last processing
         if current_size <= last_processed_size:
             return
 
+        if _is_silent(segmenter.buffer):
+            return
+
         if engine_local is None:
              if engine_task.done():
                  engine_local = engine_task.result()
@@ -365,37 +604,45 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         is_processing_partial = True
         try:
             current_audio_seconds = current_size / SAMPLE_RATE
-            partial_interval_current_ms = max(0.0, requested_interval_ms)
+            partial_interval_current_s = max(0.0, requested_interval_s)
             logger.info(
-                "Running partial: buffer=%.2fs requested_interval=%.0fms",
+                "Running partial: buffer=%.2fs interval=%.2fs",
                 current_audio_seconds,
-                partial_interval_current_ms,
+                partial_interval_current_s,
             )
             
             # Capture segment ID to verify validity later
             my_segment_id = current_segment_id
             
-            # Copy buffer for partial transcription
-            audio_copy = np.copy(segmenter.buffer)
-            
-            loop = asyncio.get_event_loop()
+            # Zero-copy snapshot: if the segment is flushed while the partial
+            # runs, the view may be overwritten, but the result is then
+            # discarded by the segment id check below.
+            audio_copy = segmenter.snapshot()
             
+            cancel_event = threading.Event()
+            partial_cancel = cancel_event
+
             # Run in executor to avoid blocking
-            start_time = time.time()
+            start_time = loop.time()
+            last_partial_started = start_time
             result = await loop.run_in_executor(
-                None, lambda: engine_local.transcribe_array(audio_copy, current_language, is_partial=True)
+                INFER_EXECUTOR, partial(_run_partial, engine_local, audio_copy, current_language, cancel_event)
+            )
+            if result is None:
+                logger.info("Partial dropped: segment %s closed before inference finished", my_segment_id)
+                return
+            process_time = loop.time() - start_time
+            last_processing_s = process_time
+            partial_ema_s = (
+                last_processing_s
+                if partial_ema_s == 0.0
+                else PARTIAL_EMA_ALPHA * last_processing_s + (1.0 - PARTIAL_EMA_ALPHA) * partial_ema_s
             )
-            process_time = time.time() - start_time
-            last_processing_ms = process_time * 1000.0
-            audio_duration = audio_copy.size / SAMPLE_RATE
             text = (result.get("text") or "").strip()
             segments = _normalize_segments(result.get("segments"))
 
-            if text in IGNORED_TEXTS:
-                text = ""
-
-            # Ignore partials that are purely non‑Latin unless explicitly allowed
-            if text and should_ignore_non_latin(text, allow_non_latin):
+            # Also drops partials that are purely non‑Latin unless explicitly allowed
+            if _should_drop(text, allow_non_latin):
                 text = ""
 
             if text:
@@ -406,18 +653,36 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                     logger.info(f"Partial result ignored: segment changed (id {my_segment_id} -> {current_segment_id})")
                 else:
                     last_processed_size = current_size
-                    logger.info(f"Partial result: '{text}' ({process_time*1000:.0f}ms)")
-                    await websocket.send_text(json.dumps({
+                    logger.info("Partial result: '%s' (%.2fs)", text, last_processing_s)
+                    if local_agreement:
+                        words = text.split()
+                        agreed = _agreed_prefix_len(prev_partial_words, words)
+                        commit_words, commit_samples = (
+                            _commit_boundary(words, agreed, segments, current_size) if agreed else (0, 0)
+                        )
+                        if commit_words and commit_samples:
+                            committed_text = " ".join(words[:commit_words])
+                            segmenter.advance(commit_samples)
+                            committed_samples += commit_samples
+                            last_processed_size -= commit_samples
+                            final_history.append(committed_text)
+                            final_index += 1
+                            send_json({"type": "commit", "text": committed_text, "index": final_index})
+                            words = words[commit_words:]
+                            text = " ".join(words)
+                            cut = commit_samples / SAMPLE_RATE
+                            segments = [
+                                {"start": round(seg["start"] - cut, 3), "end": round(seg["end"] - cut, 3), "text": seg["text"]}
+                                for seg in segments
+                                if seg["start"] >= cut
+                            ]
+                        prev_partial_words = words
+                    send_json({
                         "type": "partial",
                         "text": text,
                         "segments": segments,
-                        "stats": {
-                            "audio_duration": audio_duration,
-                            "processing_time": process_time,
-                            "processing_time_ms": int(round(process_time * 1000)),
-                            "partial_interval_ms": int(round(partial_interval_current_ms)),
-                        }
-                    }))
+                        "stats": _build_stats(audio_copy.size, process_time, partial_interval_current_s),
+                    })
             else:
                 logger.info("Partial result empty or ignored")
         except Exception as e:
@@ -426,139 +691,183 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         finally:
             is_processing_partial = False
 
-    await send_models_message()
+    async def on_silence(control: dict):
+        await segmenter.notify_silence()
+
+    async def on_select_model(control: dict):
+        nonlocal current_model, engine_local, engine_task, current_segment_id, last_processed_size, final_index
+        nonlocal history_epoch
+        nonlocal prev_partial_words, committed_samples
+
+        new_model = control.get("model")
+        if not new_model or new_model == current_model:
+            return
+
+        # Update socket counts
+        server_manager.update_socket_count(current_model, -1)
+        current_model = new_model
+        server_manager.update_socket_count(current_model, 1)
+
+        engine_local = None
+        segmenter.reset()
+        # Reset state for new model to avoid partial lag
+        current_segment_id += 1
+        if partial_cancel is not None:
+            partial_cancel.set()
+        last_processed_size = 0
+        prev_partial_words = []
+        committed_samples = 0
+        final_history.clear()
+        final_index = 0
+        history_epoch += 1
+
+        # Drop queued segments from the old model/context.
+        while not final_segments_queue.empty():
+            try:
+                final_segments_queue.get_nowait()
+                final_segments_queue.task_done()
+            except asyncio.QueueEmpty:
+                break
+
+        engine_task = asyncio.create_task(load_engine(current_model))
+        send_frame(_status_frame(wire_format, f"switching to {current_model}"))
+
+    async def on_request_models(control: dict):
+        send_models_message()
+
+    async def on_request_history(control: dict):
+        send_json({
+            "type": "history",
+            "history": final_history,
+            "index": final_index,
+        })
+
+    async def on_set_params(control: dict):
+        nonlocal min_seconds, max_seconds, current_language, allow_non_latin, local_agreement
+
+        if "min_seconds" in control or "max_seconds" in control:
+            # Keeps min_seconds valid if max decreased
+            min_seconds, max_seconds = _clamp_durations(
+                float(control.get("min_seconds", min_seconds)),
+                float(control.get("max_seconds", max_seconds)),
+            )
+            segmenter.min_seconds = min_seconds
+            segmenter.max_seconds = max_seconds
+        if "language" in control:
+            current_language = normalize_language(control["language"])
+            send_json({
+                "type": "language_update",
+                "language": current_language or "Auto"
+            })
+        if "allow_non_latin" in control:
+            allow_non_latin = bool(control["allow_non_latin"])
+        if "local_agreement" in control:
+            local_agreement = bool(control["local_agreement"])
+
+    async def on_trigger_partial(control: dict):
+        nonlocal partial_processing_task
+
+        # Cheap early outs before allocating a coroutine and Task for a
+        # partial that process_partial would skip anyway.
+        if is_processing_partial:
+            return
+        buffered = segmenter.buffer.size
+        if buffered < MIN_PARTIAL_SAMPLES or buffered <= last_processed_size:
+            return
+
+        requested_interval_s = float(control.get("interval_ms", 0)) / 1000.0
+        if partial_processing_task is None or partial_processing_task.done():
+            partial_processing_task = asyncio.create_task(process_partial(requested_interval_s))
+
+    control_handlers = {
+        "silence": on_silence,
+        "select_model": on_select_model,
+        "request_models": on_request_models,
+        "request_history": on_request_history,
+        "set_params": on_set_params,
+        "trigger_partial": on_trigger_partial,
+    }
+
+    writer_task = asyncio.create_task(drain_outbox())
+    send_models_message()
     engine_task = asyncio.create_task(load_engine(current_model))
     final_processing_task = asyncio.create_task(process_final_segments())
 
-    # Create a persistent receive task
-    receive_task = asyncio.create_task(websocket.receive())
-    last_activity_time = time.time()
+    # A persistent reader feeds the inbox and a self-rearming timer posts a
+    # silence tick, so the loop below only ever awaits one queue instead of
+    # building an asyncio.wait() set per message.
+    inbox: asyncio.Queue = asyncio.Queue()
+    last_activity_time = loop.time()
+
+    async def reader():
+        nonlocal last_activity_time
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                last_activity_time = loop.time()
+                inbox.put_nowait(message)
+        except RuntimeError as exc:
+            logger.error("Runtime error on websocket receive: %s", exc, exc_info=True)
+        finally:
+            inbox.put_nowait(None)
+
+    def silence_tick():
+        nonlocal silence_handle
+        remaining = last_activity_time + min_seconds - loop.time()
+        if remaining <= 0:
+            inbox.put_nowait(_SILENCE_TICK)
+            remaining = min_seconds
+        silence_handle = loop.call_later(remaining, silence_tick)
+
+    reader_task = asyncio.create_task(reader())
+    silence_handle = loop.call_later(min_seconds, silence_tick)
 
     try:
         while True:
-            try:
-                # Determine wait time
-                now = time.time()
-                time_since_activity = now - last_activity_time
-                
-                wait_timeout = min_seconds
-                
-                # Also ensure we don't sleep past the silence timeout
-                remaining_silence_time = min_seconds - time_since_activity
-                if remaining_silence_time > 0:
-                    wait_timeout = min(wait_timeout, remaining_silence_time)
-                else:
-                    wait_timeout = 0 # Check immediately
-
-                tasks = [receive_task]
-                if partial_processing_task is not None and not partial_processing_task.done():
-                    tasks.append(partial_processing_task)
-
-                done, pending = await asyncio.wait(tasks, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
-
-                if partial_processing_task in done:
-                    try:
-                        partial_processing_task.result()
-                    except Exception as e:
-                        logger.error(f"Partial task error: {e}")
-
-                if receive_task in done:
-                    # Message received
-                    message = receive_task.result()
-                    last_activity_time = time.time()
-                    
-                    # Prepare next receive task immediately
-                    receive_task = asyncio.create_task(websocket.receive())
-                    
-                    if "text" in message and message["text"]:
-                        try:
-                            control = json.loads(message["text"])
-                        except json.JSONDecodeError:
-                            continue
-                        
-                        ctype = control.get("type")
-                        if ctype == "silence":
-                            await segmenter.notify_silence()
-                        elif ctype == "select_model":
-                            new_model = control.get("model")
-                            if new_model and new_model != current_model:
-                                # Update socket counts
-                                server_manager.update_socket_count(current_model, -1)
-                                current_model = new_model
-                                server_manager.update_socket_count(current_model, 1)
-                                
-                                engine_local = None
-                                segmenter.reset()
-                                # Reset state for new model to avoid partial lag
-                                current_segment_id += 1
-                                last_processed_size = 0
-                                
-                                # Drop queued segments from the old model/context.
-                                while not final_segments_queue.empty():
-                                    try:
-                                        final_segments_queue.get_nowait()
-                                        final_segments_queue.task_done()
-                                    except asyncio.QueueEmpty:
-                                        break
-
-                                engine_task = asyncio.create_task(load_engine(current_model))
-                                await websocket.send_text(json.dumps({"status": f"switching to {current_model}"}))
-                        elif ctype == "request_models":
-                            await send_models_message()
-                        elif ctype == "set_params":
-                            # Update params
-                            if "min_seconds" in control:
-                                segmenter.min_seconds = float(control["min_seconds"])
-                                min_seconds = segmenter.min_seconds
-                            if "max_seconds" in control:
-                                next_max = float(control["max_seconds"])
-                                max_seconds = max(1.0, min(next_max, 60.0))
-                                segmenter.max_seconds = max_seconds
-                                # Keep min_seconds valid if max decreased
-                                if min_seconds > max_seconds:
-                                    min_seconds = max_seconds
-                                    segmenter.min_seconds = min_seconds
-                            if "language" in control:
-                                current_language = normalize_language(control["language"])
-                                await websocket.send_text(json.dumps({
-                                    "type": "language_update",
-                                    "language": current_language or "Auto"
-                                }))
-                            if "allow_non_latin" in control:
-                                allow_non_latin = bool(control["allow_non_latin"])
-                        elif ctype == "trigger_partial":
-                            requested_interval_ms = float(control.get("interval_ms", 0))
-                            if partial_processing_task is None or partial_processing_task.done():
-                                partial_processing_task = asyncio.create_task(process_partial(requested_interval_ms))
-
-                    if "bytes" in message and message["bytes"]:
-                        chunk = np.frombuffer(message["bytes"], dtype=np.float32)
-                        await segmenter.push_audio_chunk(chunk)
-                        # logger.info(f"Received chunk: {len(chunk)} samples") # Too verbose for every chunk? Maybe debug level.
-                        
-                else:
-                    # Timeout occurred
-                    # Check if it's a silence timeout
-                    if time.time() - last_activity_time >= min_seconds:
-                        # If we have data in buffer, flush it now
-                        await segmenter.flush()
-                        # Reset activity time to avoid repeated flushing if no new data comes
-                        last_activity_time = time.time()
-                
-                # Partial execution is now frontend-triggered via control message "trigger_partial".
-
-            except WebSocketDisconnect:
-                break
-            except RuntimeError as exc:
-                logger.error("Runtime error on websocket receive: %s", exc, exc_info=True)
+            message = await inbox.get()
+            if message is None:
                 break
-                
+
+            if message is _SILENCE_TICK:
+                # No input for min_seconds: flush whatever is buffered, and
+                # reset activity time to avoid repeated flushing.
+                await segmenter.flush()
+                last_activity_time = loop.time()
+                continue
+
+            # Audio is the hot path: binary frames skip JSON entirely.
+            audio_bytes = message.get("bytes")
+            if audio_bytes:
+                # While the model is still loading, pure-silence chunks are
+                # dropped before they ever reach the segmenter buffer.
+                if not engine_task.done():
+                    chunk = np.frombuffer(audio_bytes, dtype=np.float32, count=len(audio_bytes) // 4)
+                    if float(np.dot(chunk, chunk)) < SILENCE_ENERGY_FLOOR * chunk.size:
+                        continue
+                await segmenter.push_audio_raw(audio_bytes)
+                continue
+
+            text_frame = message.get("text")
+            if text_frame:
+                try:
+                    control = orjson.loads(text_frame)
+                except orjson.JSONDecodeError:
+                    continue
+
+                handler = control_handlers.get(control.get("type"))
+                if handler is not None:
+                    await handler(control)
+
+            # Partial execution is frontend-triggered via control message "trigger_partial".
+
     except WebSocketDisconnect:
         pass
     except Exception as exc:
         logger.error("Unhandled websocket exception: %s", exc, exc_info=True)
         try:
-            await websocket.send_text(json.dumps({"error": str(exc)}))
+            await write_frame(encode_frame({"error": str(exc)}))
         except Exception:
             pass
     finally:
@@ -570,10 +879,14 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             await final_segments_queue.put(None)
             with contextlib.suppress(asyncio.CancelledError):
                 await final_processing_task
-        if receive_task is not None and not receive_task.done():
-            receive_task.cancel()
+        silence_handle.cancel()
+        if not reader_task.done():
+            reader_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await receive_task
+                await reader_task
+        writer_task.cancel()
+        with contextlib.suppress(Exception, asyncio.CancelledError):
+            await writer_task
 
         server_manager.update_socket_count(current_model, -1)
         logger.info("WebSocket disconnected")